@@ -25,6 +25,7 @@ to make the porting SV to Python faster.
 
 import re
 import random
+import functools
 import cocotb
 #from cocotb_coverage.coverage import *
 from cocotb_coverage import crv
@@ -39,11 +40,15 @@ RET_ERR = 1
 RET_OK = 0
 
 
+@functools.lru_cache(maxsize=4096)
+def _re_compile(rex):
+    # The same scope/name patterns are matched over and over, so keep compiled
+    # patterns around instead of relying on the small internal cache of re
+    return re.compile(rex)
+
+
 def uvm_re_match(rex, _str):
-    m = re.search(rex, _str)
-    if m is not None:
-        return RET_OK
-    return RET_ERR
+    return RET_OK if _re_compile(rex).search(_str) is not None else RET_ERR
 
 
 def uvm_glob_to_re(_str):
@@ -58,20 +63,64 @@ def uvm_glob_to_re(_str):
         return ""
     if _str[0] == "/" and _str[-1] == "/":
         return _str
-    # TODO replace * with .*
-    res = _str.replace('.', '\\.')
-    res = res.replace('*', '.*')
-    res = res.replace('[', '\\[')
-    res = res.replace(']', '\\]')
-    res = res.replace('?', '.')
+    return _glob_to_re(_str)
+
+
+# Matches glob chars needing escaping (group 1), '*' (group 2) and '?'
+_GLOB_RE = re.compile(r'([.\[\]])|(\*)|(\?)')
+
+
+def _glob_sub(m):
+    if m.group(1) is not None:
+        return '\\' + m.group(1)
+    if m.group(2) is not None:
+        return '.*'
+    return '.'
+
+
+@functools.lru_cache(maxsize=1024)
+def _glob_to_re(_str):
     # TODO add more substitutions
-    return res
+    return _GLOB_RE.sub(_glob_sub, _str)
+
+
+# Read-only: _SV_FMT_RE is compiled from this once at import
+_SV_FORMATS = ("%b", "%0b", "%0d", "%d", "%s", "%0s", "%h", "%0h", "%f",
+        "%p", "%0t", "%t", "%x")
+_SV_FMT_MAP = {"%h": "{:X}", "%0h": "{:X}"}
+_SV_FMT_RE = re.compile('|'.join(re.escape(f) for f in _SV_FORMATS))
+
+
+# Types for which '%s' % val gives the same output as '{}'.format(val).
+# Subclasses (ie IntEnum) are excluded as they may override __format__.
+_PCT_SAFE_TYPES = frozenset((str, int, float, bool))
+
+
+@functools.lru_cache(maxsize=4096)
+def _sv_fmt_to_py(msg):
+    """
+    Translates SV format specifiers in msg into Python format strings.
+    Format strings are usually literals, so the result is cached.
+
+    Returns:
+        tuple: (str.format() template, printf-style template or None,
+        number of specifiers). The printf-style template is only given when
+        it produces the same output as the str.format() one, ie there are no
+        hex specifiers, braces or stray '%' characters in msg. sformatf also
+        requires all args to be of a type in _PCT_SAFE_TYPES.
+    """
+    specs = _SV_FMT_RE.findall(msg)
+    fmt = _SV_FMT_RE.sub(lambda m: _SV_FMT_MAP.get(m.group(0), "{}"), msg)
+    pct_fmt = None
+    if (not any(s in _SV_FMT_MAP for s in specs) and '{' not in msg and
+            '}' not in msg and msg.count('%') == len(specs)):
+        pct_fmt = _SV_FMT_RE.sub("%s", msg)
+    return fmt, pct_fmt, len(specs)
 
 
 def uvm_split_string(_str, sep, split_vals):
     res = _str.split(sep)
-    for val in res:
-        split_vals.append(val)
+    split_vals.extend(res)
     return res
 
 
@@ -83,6 +132,8 @@ class process():
     SUSPENDED = 3
     KILLED = 4
 
+    __slots__ = ('status', 'pid')
+
     def __init__(self):
         self.status = process.RUNNING
         self.pid = -1
@@ -93,12 +144,9 @@ class sv:
 
     @classmethod
     def clog2(cls, value):
-        value = value - 1
-        res = 0
-        while value > 0:
-            value = value >> 1
-            res += 1
-        return res
+        if value <= 1:
+            return 0
+        return (value - 1).bit_length()
 
     @classmethod
     def display(cls, msg, *args):
@@ -125,13 +173,13 @@ class sv:
         else:
             print(msg)
 
-    @classmethod
-    def isunknown(cls, value):
+    @staticmethod
+    def isunknown(value):
         # TODO implement this properly
         return False
 
-    @classmethod
-    def bits(cls, var):
+    @staticmethod
+    def bits(var):
         if isinstance(var, int):
             return 32
         return 0
@@ -163,8 +211,8 @@ class sv:
         return False
 
     STR_RE = re.compile(r'%(\d*[bdshxfpt])')
-    formats = ["%b", "%0b", "%0d", "%d", "%s", "%0s", "%h", "%0h", "%f",
-            "%p", "%0t", "%t", "%x"]
+    # SV format specifiers handled by sformatf (read-only)
+    formats = _SV_FORMATS
 
     @classmethod
     def sformatf(cls, msg, *args):
@@ -184,24 +232,25 @@ class sv:
         # TODO substitute old types %s/%d etc with {}
         #new_msg = cls.STR_RE.sub(r'{:\1}', msg)
         #print("new_msg is " + new_msg)
-        for s in cls.formats:
-            if s == "%h" or s == "%0h":
-                msg = msg.replace(s, "{:X}")
-            else:
-                msg = msg.replace(s, "{}")
-        return msg.format(*args)
+        if not args:
+            return msg
+        fmt, pct_fmt, num_specs = _sv_fmt_to_py(msg)
+        if (pct_fmt is not None and len(args) == num_specs and
+                all(type(a) in _PCT_SAFE_TYPES for a in args)):
+            return pct_fmt % args
+        return fmt.format(*args)
 
     @classmethod
     def random(cls):
-        return random.randint(0, SV_MAX_INT_VALUE)
+        return _getrandbits(31)
 
     @classmethod
     def urandom(cls):
-        return random.randint(0, SV_MAX_INT_VALUE)
+        return _getrandbits(31)
 
     @classmethod
     def urandom_range(cls, start, stop):
-        return random.randint(start, stop)
+        return _randrange(start, stop + 1)
 
     @classmethod
     def sv_assert(cls, val, msg=""):
@@ -213,24 +262,19 @@ class sv:
 
     @classmethod
     def value_plusargs(cls, arg_str, arr):
-        plusarg_dict = cocotb.plusargs
-        for name in plusarg_dict:
-            full_arg = name + '='
-            for i in range(len(full_arg)):
-                if full_arg[i] != arg_str[i]:
-                    break
-                elif i == len(full_arg) - 1:
-                    arr.append(plusarg_dict[name])
-                    return plusarg_dict[name]
+        for name, val in cocotb.plusargs.items():
+            if arg_str.startswith(name + '='):
+                arr.append(val)
+                return val
 
     @classmethod
     async def fork_join(cls, forks):
-        join_list = list(map(lambda t: t.join(), forks))
+        join_list = [t.join() for t in forks]
         await Combine(*join_list)
 
     @classmethod
     async def fork_join_any(cls, forks):
-        join_list = list(map(lambda t: t.join(), forks))
+        join_list = [t.join() for t in forks]
         await First(*join_list)
 
     @classmethod
@@ -245,6 +289,11 @@ random.seed(0)
 
 SV_MAX_INT_VALUE = (1 << 31) - 1
 
+# Bound methods of the module-level generator, so random.seed() still
+# applies to them. getrandbits(31) covers [0, SV_MAX_INT_VALUE] exactly.
+_getrandbits = random.getrandbits
+_randrange = random.randrange
+
 
 class sv_obj(crv.Randomized):
     """ sv_obj implement some basic features from SystemVerilog objects like
@@ -288,35 +337,37 @@ class sv_obj(crv.Randomized):
         try:
             ok = True
             if recurse:
-                for entry in self._sv_rand_obj:
-                    obj = entry
-                    if hasattr(self, entry):
-                        obj = getattr(self, entry)
-                    ok = ok and obj.randomize()
+                ok = self._sv_randomize_objs()
             super().randomize()
-            return True and ok
-        except:
-            # TODO this can mask all sorts of errors
+            return ok
+        except Exception:
+            # crv raises plain Exceptions when constraints cannot be resolved
             return False
 
 
     def randomize_with(self, *constr):
         try:
-            ok = True
-            for entry in self._sv_rand_obj:
-                obj = entry
-                if hasattr(self, entry):
-                    obj = getattr(self, entry)
-                ok = ok and obj.randomize()
+            ok = self._sv_randomize_objs()
             super().randomize_with(*constr)
-            return True and ok
-        except:
-            # TODO this can mask all sorts of errors
+            return ok
+        except Exception:
             return False
 
+    def _sv_randomize_objs(self):
+        """ Randomizes sub-objects marked with rand(), stops at first failure """
+        for entry in self._sv_rand_obj:
+            obj = entry
+            if isinstance(entry, str):
+                obj = getattr(self, entry)
+            if not obj.randomize():
+                return False
+        return True
+
 
 class semaphore():
 
+    __slots__ = ('max_count', 'count', 'lock', 'locked')
+
     def __init__(self, count=1):
         self.max_count = count
         self.count = count
@@ -363,11 +414,7 @@ def sformatf(fmt, *args):
 
 
 def cat(*args):
-    ret = ""
-    for a in args:
-        ret += a
-
-    return ret
+    return "".join(args)
 
 
 
@@ -27,7 +27,8 @@ from cocotb.triggers import Event, Timer
 
 from .sv import sv, wait
 from .uvm_object import UVMObject
-from .uvm_queue import UVMQueue
+from .uvm_object_globals import UVM_NONE
+from .uvm_globals import uvm_report_warning
 from .uvm_debug import *
 
 #//------------------------------------------------------------------------------
@@ -55,31 +56,41 @@ class UVMEventBase(UVMObject):
         self.m_event = Event()
         self.num_waiters = 0
         self.on = False
-        self.on_event = Event("on_event_" + name)
         self.trigger_time = 0
-        self.callbacks = UVMQueue()  # uvm_event_callback
+        self.callbacks = []  # uvm_event_callback
         self.m_waiters = 0
-        self.m_value_changed_event = Event("value_changed_event_" + name)
+        # Event names are only used for debugging, so skip building them
+        # unless debug is enabled
+        if UVMDebug.DEBUG:
+            self.on_event = Event("on_event_" + name)
+            self.m_value_changed_event = Event("value_changed_event_" + name)
+        else:
+            self.on_event = Event()
+            self.m_value_changed_event = Event()
 
 
     def set_value(self, key, value):
         setattr(self, key, value)
         self.m_value_changed_event.set()
 
+    def _set_on(self, on):
+        self.on = on
+        self.m_value_changed_event.set()
+
     def set(self):
         if self.m_waiters > 0:
             self.on_event.set()
 
     
     async def wait(self):
-        if self.m_waiters == 0:
-            self.on_event.clear()
-
+        # on_event is only set while there are waiters, and the last waiter
+        # to resume clears it, so no clear() is needed before waiting
+        on_event = self.on_event
         self.m_waiters += 1
-        await self.on_event.wait()
+        await on_event.wait()
         self.m_waiters -= 1
         if self.m_waiters == 0:
-            self.on_event.clear()
+            on_event.clear()
         # else-branch needed with Timer(0)
 
     async def wait_on(self, delta=False):
@@ -220,9 +231,15 @@ class UVMEventBase(UVMObject):
         """
         if wakeup is True:
             self.m_event.set()
-        self.m_event = Event()
+        if wakeup is True or self.num_waiters == 0:
+            # Nobody is left waiting on m_event, so it can be reused
+            self.m_event.clear()
+        else:
+            # As in SV, processes still waiting are not released by a later
+            # trigger, so they are left on the old event
+            self.m_event = Event()
         self.num_waiters = 0
-        self.set_value("on", False)
+        self._set_on(False)
         self.trigger_time = 0
 
 
@@ -354,21 +371,18 @@ class UVMEvent(UVMEventBase):  # (type T=uvm_object) extends uvm_event_base
         Args:
             data: 
         """
+        callbacks = self.callbacks
         skip = False
-        if self.callbacks.size() > 0:
-            for i in range(0, self.callbacks.size()):
-                #uvm_event_callback#(T) tmp=self.callbacks[i]
-                tmp = self.callbacks.get(i)
-            skip = skip + tmp.pre_trigger(self, data)
-        if skip is False:
+        # All pre_trigger callbacks are called, even if one already skips
+        for cb in callbacks:
+            if cb.pre_trigger(self, data):
+                skip = True
+        if not skip:
             self.m_event.set(data)
-            if self.callbacks.size() > 0:
-                for i in range(0, self.callbacks.size()):
-                    #uvm_event_callback#(T) tmp=self.callbacks[i]
-                    tmp = self.callbacks[i]
-                    tmp.post_trigger(self,data)
+            for cb in callbacks:
+                cb.post_trigger(self, data)
             self.num_waiters = 0
-            self.set_value("on", True)
+            self._set_on(True)
             self.trigger_time = sv.realtime()
             self.trigger_data = data
 
@@ -25,12 +25,13 @@
 #   preserved where possible.
 # ------------------------------------------------------------------------------
 
+import os
+import sys
 import cocotb
 from cocotb.triggers import Timer
 from cocotb.utils import get_sim_time, simulator
 from .uvm_object_globals import *
-from .sv import uvm_glob_to_re, uvm_re_match
-from inspect import getframeinfo, stack
+from .sv import uvm_glob_to_re, _re_compile
 
 # Title: Globals
 
@@ -48,8 +49,7 @@ from inspect import getframeinfo, stack
 
 
 async def run_test(test_name=""):
-    cs = get_cs()
-    top = cs.get_root()
+    top = _get_top()
     await top.run_test(test_name)
 
 #//----------------------------------------------------------------------------
@@ -84,9 +84,27 @@ async def run_test(test_name=""):
 # Static methods cannot call non-static methods of the same class.
 
 def uvm_report_enabled(verbosity, severity=UVM_INFO, id=""):
-    cs = get_cs()
-    top = cs.get_root()
-    return top.uvm_report_enabled(verbosity,severity,id)
+    id_cache = _verb_cache.get(severity)
+    if id_cache is None:
+        id_cache = _verb_cache[severity] = {}
+    max_verb = id_cache.get(id)
+    if max_verb is None:
+        max_verb = _get_top().get_report_verbosity_level(severity, id)
+        id_cache[id] = max_verb
+    return max_verb >= verbosity
+
+
+# Verbosity levels of uvm_root per severity and id, used by uvm_report_enabled
+_verb_cache = {}
+
+
+def uvm_invalidate_report_cache():
+    """
+    Clears the verbosity levels cached by `uvm_report_enabled`. This is
+    called by the report handlers whenever verbosity settings change, so users
+    need to call it only if they modify report handler state directly.
+    """
+    _verb_cache.clear()
 
 
 #// Function: uvm_report
@@ -108,17 +126,20 @@ def uvm_report_enabled(verbosity, severity=UVM_INFO, id=""):
 #endfunction
 
 
+def _caller_file_line():
+    """ Returns filename and line number of the caller of a uvm_report_* function """
+    caller = sys._getframe(2)
+    return caller.f_code.co_filename, caller.f_lineno
+
+
 def uvm_report_info(id, message, verbosity=UVM_MEDIUM, filename="", line=0,
         context_name="", report_enabled_checked=False):
     if uvm_report_enabled(verbosity, UVM_INFO, id):
-        cs = get_cs()
-        top = cs.get_root()
-        if filename == "":
-            caller = getframeinfo(stack()[1][0])
-            filename = caller.filename
-        if line == 0:
-            caller = getframeinfo(stack()[1][0])
-            line = caller.lineno
+        top = _get_top()
+        if filename == "" or line == 0:
+            fname, lineno = _caller_file_line()
+            filename = filename or fname
+            line = line or lineno
         top.uvm_report_info(id, message, verbosity, filename, line, context_name,
                 report_enabled_checked)
 
@@ -126,14 +147,11 @@ def uvm_report_info(id, message, verbosity=UVM_MEDIUM, filename="", line=0,
 def uvm_report_error(id, message, verbosity=UVM_LOW, filename="", line=0,
         context_name="", report_enabled_checked=False):
     if uvm_report_enabled(verbosity, UVM_ERROR, id):
-        cs = get_cs()
-        top = cs.get_root()
-        if filename == "":
-            caller = getframeinfo(stack()[1][0])
-            filename = caller.filename
-        if line == 0:
-            caller = getframeinfo(stack()[1][0])
-            line = caller.lineno
+        top = _get_top()
+        if filename == "" or line == 0:
+            fname, lineno = _caller_file_line()
+            filename = filename or fname
+            line = line or lineno
         top.uvm_report_error(id, message, verbosity, filename, line, context_name,
                 report_enabled_checked)
 
@@ -141,14 +159,11 @@ def uvm_report_error(id, message, verbosity=UVM_LOW, filename="", line=0,
 def uvm_report_warning(id, message, verbosity=UVM_LOW, filename="", line=0,
         context_name="", report_enabled_checked=False):
     if uvm_report_enabled(verbosity, UVM_WARNING, id):
-        cs = get_cs()
-        top = cs.get_root()
-        if filename == "":
-            caller = getframeinfo(stack()[1][0])
-            filename = caller.filename
-        if line == 0:
-            caller = getframeinfo(stack()[1][0])
-            line = caller.lineno
+        top = _get_top()
+        if filename == "" or line == 0:
+            fname, lineno = _caller_file_line()
+            filename = filename or fname
+            line = line or lineno
         top.uvm_report_warning(id, message, verbosity, filename, line, context_name,
                 report_enabled_checked)
 
@@ -167,14 +182,11 @@ def uvm_report_warning(id, message, verbosity=UVM_LOW, filename="", line=0,
 def uvm_report_fatal(id, message, verbosity=UVM_NONE, filename="", line=0,
         context_name="", report_enabled_checked=False):
     if uvm_report_enabled(verbosity, UVM_FATAL, id):
-        cs = get_cs()
-        top = cs.get_root()
-        if filename == "":
-            caller = getframeinfo(stack()[1][0])
-            filename = caller.filename
-        if line == 0:
-            caller = getframeinfo(stack()[1][0])
-            line = caller.lineno
+        top = _get_top()
+        if filename == "" or line == 0:
+            fname, lineno = _caller_file_line()
+            filename = filename or fname
+            line = line or lineno
         top.uvm_report_fatal(id, message, verbosity, filename, line, context_name,
                 report_enabled_checked)
 
@@ -246,8 +258,7 @@ def uvm_report_fatal(id, message, verbosity=UVM_NONE, filename="", line=0,
 #
 #----------------------------------------------------------------------------
 def uvm_is_match(expr, _str):
-    s = uvm_glob_to_re(expr)
-    return uvm_re_match(s, _str) == 0
+    return _re_compile(uvm_glob_to_re(expr)).search(_str) is not None
 
 
 UVM_LINE_WIDTH = 120
@@ -288,9 +299,13 @@ UVM_LARGE_STRING = UVM_LINE_WIDTH*UVM_NUM_LINES*8-1
 # other processes any number of delta cycles (#0) to settle out before
 # continuing. See <uvm_sequencer_base::wait_for_sequences> for example usage.
 #
+# uvm-python NOTE: Each #0 is an await of Timer(0), ie a round-trip through
+# the simulator. The number of them (SV define UVM_POUND_ZERO_COUNT) can be
+# lowered with the environment variable of the same name, if the testbench
+# is known to settle in fewer delta cycles.
 #----------------------------------------------------------------------------
 
-UVM_POUND_ZERO_COUNT = 1000
+UVM_POUND_ZERO_COUNT = int(os.environ.get("UVM_POUND_ZERO_COUNT", 1000))
 UVM_NO_WAIT_FOR_NBA = True
 
 
@@ -318,6 +333,18 @@ def get_cs():
     from .uvm_coreservice import UVMCoreService
     return UVMCoreService.get()
 
+
+# uvm_root is a singleton that is never replaced, so it is resolved once and
+# reused by the global reporting functions
+_cached_top = None
+
+
+def _get_top():
+    global _cached_top
+    if _cached_top is None:
+        _cached_top = get_cs().get_root()
+    return _cached_top
+
 #// Class: uvm_enum_wrapper#(T)
 #//
 #// The ~uvm_enum_wrapper#(T)~ class is a utility mechanism provided
@@ -412,11 +439,18 @@ async def uvm_empty_delay():
     await Timer(0, "NS")
 
 
+# Output arg checks are skipped when Python runs with -O
+_UVM_CHECK_ARGS = __debug__
+
+
 def uvm_check_output_args(arr):
     """     
-    Check that all args in the arr are lists to emulate the SV inout/output/ref args
+    Check that all args in the arr are lists to emulate the SV inout/output/ref args.
+    The check is skipped when Python is run with optimizations (-O).
     Raises:
     """
+    if not _UVM_CHECK_ARGS:
+        return
     for item in arr:
         if not isinstance(item, list):
             raise Exception('All output args must be given as empty arrays. Got: '
@@ -21,11 +21,12 @@
 #//   permissions and limitations under the License.
 #//------------------------------------------------------------------------------
 
-import collections
-
 from .uvm_object import UVMObject
 from ..macros import uvm_warning
 
+# Sentinel for missing keys, since None is a valid item in a pool
+_MISSING = object()
+
 #//------------------------------------------------------------------------------
 #//
 #// CLASS: uvm_pool #(KEY,T)
@@ -43,9 +44,12 @@ class UVMPool(UVMObject):
 
     def __init__(self, name="", T=None):
         UVMObject.__init__(self, name)
-        self.pool = collections.OrderedDict()
+        self.pool = {}
         self.ptr = -1
         self.T = T
+        # Snapshot of keys for the first/next/prev/last cursor, built lazily
+        # and invalidated whenever keys are added or removed
+        self._keys_cache = None
 
     @classmethod
     def get_global_pool(cls):
@@ -89,18 +93,48 @@ class UVMPool(UVMObject):
             key: 
         Returns:
         """
-        if key in self.pool:
-            return self.pool[key]
+        item = self.pool.get(key, _MISSING)
+        if item is not _MISSING:
+            return item
         elif self.T is not None:
-            self.pool[key] = self.T()
-            return self.pool[key]
+            item = self.T()
+            self.pool[key] = item
+            self._keys_cache = None
+            return item
         return None
 
+    def get_many(self, keys):
+        """
+        Function: get_many
+
+        Returns a list of items for the given `keys`, in the same order. Missing
+        items are handled like in `get`. This is faster than calling `get`
+        for each key separately.
+        Args:
+            keys: Iterable of keys
+        Returns:
+            list: Items matching the keys
+        """
+        pool = self.pool
+        T = self.T
+        items = []
+        for key in keys:
+            item = pool.get(key, _MISSING)
+            if item is _MISSING:
+                item = None
+                if T is not None:
+                    item = T()
+                    pool[key] = item
+                    self._keys_cache = None
+            items.append(item)
+        return items
+
     def add(self, key, item):
         self.pool[key] = item
+        self._keys_cache = None
 
     def num(self):
-        return len(self.pool.keys())
+        return len(self.pool)
 
     def keys(self):
         return self.pool.keys()
@@ -114,14 +148,14 @@ class UVMPool(UVMObject):
         else:
             if key in self.pool:
                 del self.pool[key]
+        self._keys_cache = None
 
     def exists(self, key):
         return key in self.pool
 
     def last(self):
-        keys = self.pool.keys()
-        if len(keys) > 0:
-            self.ptr = self.num() - 1
+        if len(self.pool) > 0:
+            self.ptr = len(self.pool) - 1
             return next(reversed(self.pool))
         else:
             return False
@@ -147,8 +181,7 @@ class UVMPool(UVMObject):
     def next(self):
         if self.has_next() is True:
             self.ptr += 1
-            key = list(self.pool.keys())[self.ptr]
-            return key
+            return self._get_keys()[self.ptr]
         return None
 
     def has_prev(self):
@@ -159,17 +192,19 @@ class UVMPool(UVMObject):
     def prev(self):
         if self.has_prev() is True:
             self.ptr -= 1
-            key = list(self.pool.keys())[self.ptr]
-            return key
+            return self._get_keys()[self.ptr]
         return None
 
+    def _get_keys(self):
+        if self._keys_cache is None:
+            self._keys_cache = list(self.pool)
+        return self._keys_cache
+
     def create(self, name=""):
         return UVMPool(name, self.T)
 
     def do_print(self, printer):
-        while self.has_next():
-            key = self.next()
-            item = self.pool[key]
+        for key, item in self.pool.items():
             # print_generic(self, name, type_name, size, value, scope_separator="."):
             if hasattr(item, 'convert2string'):
                 printer.print_string(item.get_name(), item.convert2string())
@@ -203,6 +238,7 @@ class UVMPool(UVMObject):
             value: 
         """
         self.pool[key] = value
+        self._keys_cache = None
 
     def __getitem__(self, key):
         """         
@@ -306,11 +342,36 @@ class UVMObjectStringPool(UVMPool):  # (type T=uvm_object) extends uvm_pool #(st
             key: 
         Returns:
         """
-        if key not in self.pool:
-            self.pool[key] = self.Constructor(key)
-        return self.pool[key]
+        item = self.pool.get(key, _MISSING)
+        if item is _MISSING:
+            item = self.Constructor(key)
+            self.pool[key] = item
+            self._keys_cache = None
+        return item
     #  endfunction
 
+    def get_many(self, keys):
+        """
+          Function: get_many
+
+          Returns a list of object items for the given string `keys`. Missing
+          items are created like in `get`.
+        Args:
+            keys: Iterable of keys
+        Returns:
+            list: Items matching the keys
+        """
+        pool = self.pool
+        items = []
+        for key in keys:
+            item = pool.get(key, _MISSING)
+            if item is _MISSING:
+                item = self.Constructor(key)
+                pool[key] = item
+                self._keys_cache = None
+            items.append(item)
+        return items
+
     def delete(self, key):
         """         
           Function: delete
@@ -323,7 +384,8 @@ class UVMObjectStringPool(UVMPool):  # (type T=uvm_object) extends uvm_pool #(st
         if not self.exists(key):
             uvm_warning("POOLDEL", "delete: key '{}' doesn't exist".format(key))
             return
-        self.delete(key)
+        del self.pool[key]
+        self._keys_cache = None
     #  endfunction
 
     def do_print(self, printer):
@@ -332,17 +394,10 @@ class UVMObjectStringPool(UVMPool):  # (type T=uvm_object) extends uvm_pool #(st
         Args:
             printer: 
         """
-        key = ""
-        num_keys = len(list(self.pool.keys()))
+        num_keys = len(self.pool)
         printer.print_array_header("pool", num_keys,"aa_object_string")
-        if self.has_first():
-            key = self.first()
-            while True:
-                printer.print_object("[" + key + "]", self.pool[key],"[")
-                if self.has_next():
-                    key = self.next()
-                else:
-                    break
+        for key, obj in self.pool.items():
+            printer.print_object("[" + key + "]", obj, "[")
         printer.print_array_footer()
     # endfunction
 
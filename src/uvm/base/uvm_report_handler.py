@@ -25,7 +25,7 @@
 from .uvm_object import UVMObject
 from .uvm_pool import UVMPool
 from .uvm_object_globals import *
-from .uvm_globals import uvm_report_enabled
+from .uvm_globals import uvm_report_enabled, uvm_invalidate_report_cache
 from ..macros.uvm_object_defines import uvm_object_utils
 
 #//------------------------------------------------------------------------------
@@ -367,6 +367,7 @@ class UVMReportHandler(UVMObject):
         """
         self.set_default_file(0)
         self.m_max_verbosity_level = UVM_MEDIUM
+        uvm_invalidate_report_cache()
         self.set_severity_action(UVM_INFO,    UVM_DISPLAY)
         self.set_severity_action(UVM_WARNING, UVM_DISPLAY)
         self.set_severity_action(UVM_ERROR,   UVM_DISPLAY | UVM_COUNT)
@@ -409,6 +410,7 @@ class UVMReportHandler(UVMObject):
             verbosity_level: 
         """
         self.m_max_verbosity_level = verbosity_level
+        uvm_invalidate_report_cache()
 
     def get_verbosity_level(self, severity=UVM_INFO, id=""):
         """         
@@ -528,6 +530,7 @@ class UVMReportHandler(UVMObject):
             verbosity: 
         """
         self.id_verbosities.add(id, verbosity)
+        uvm_invalidate_report_cache()
 
     def set_severity_id_verbosity(self, severity, id, verbosity):
         """         
@@ -540,6 +543,7 @@ class UVMReportHandler(UVMObject):
         if severity not in self.severity_id_verbosities:
             self.severity_id_verbosities[severity] = UVMPool()
         self.severity_id_verbosities[severity].add(id,verbosity)
+        uvm_invalidate_report_cache()
 
     def set_default_file(self, file):
         """         
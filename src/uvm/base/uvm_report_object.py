@@ -25,6 +25,7 @@ from .uvm_object import UVMObject
 from .uvm_object_globals import (UVM_WARNING, UVM_INFO, UVM_ERROR, UVM_FATAL, UVM_LOW, UVM_NONE,
         UVM_MEDIUM)
 from .uvm_report_message import UVMReportMessage
+from .uvm_globals import uvm_invalidate_report_cache
 
 
 def get_verbosity(severity):
@@ -457,6 +458,7 @@ class UVMReportObject(UVMObject):
             handler: 
         """
         self.m_rh = handler
+        uvm_invalidate_report_cache()
 
     def get_report_handler(self):
         """         
@@ -34,9 +34,11 @@
 # in the hierarchy.
 
 from .uvm_phase import UVMPhase
+from .uvm_domain import UVMDomain
 from .uvm_globals import *
-from .uvm_debug import uvm_debug
-from .uvm_object_globals import UVM_PHASE_IMP, UVM_PHASE_STARTED
+from .uvm_debug import uvm_debug, UVMDebug
+from .uvm_object_globals import (UVM_PHASE_IMP, UVM_PHASE_STARTED,
+    UVM_PHASE_EXECUTING, UVM_PHASE_READY_TO_END, UVM_PHASE_ENDED)
 
 
 class UVMTopdownPhase(UVMPhase):
@@ -51,6 +53,12 @@ class UVMTopdownPhase(UVMPhase):
             name: 
         """
         UVMPhase.__init__(self, name, UVM_PHASE_IMP)
+        self._state_handlers = {
+            UVM_PHASE_STARTED: self._on_started,
+            UVM_PHASE_EXECUTING: self._on_executing,
+            UVM_PHASE_READY_TO_END: self._on_ready_to_end,
+            UVM_PHASE_ENDED: self._on_ended,
+        }
 
     def traverse(self, comp, phase, state):
         """         
@@ -64,13 +72,28 @@ class UVMTopdownPhase(UVMPhase):
             phase: 
             state: 
         """
-        uvm_debug(self, 'traverse', self.get_name() +
-            ' traversing topdown phase now with comp' + comp.get_name())
-        name = ""
+        common_domain = UVMDomain.get_common_domain()
         phase_domain = phase.get_domain()
+        # Iterative pre-order walk. Children are collected only after their
+        # parent has been visited, since build may create them.
+        stack = [comp]
+        while stack:
+            comp = stack.pop()
+            self._visit(comp, phase, state, common_domain, phase_domain)
+            # Read the children list directly instead of via the child cursor.
+            # extend() consumes the iterator, so this is a snapshot.
+            stack.extend(reversed(comp.m_children_ordered))
+
+    def _visit(self, comp, phase, state, common_domain, phase_domain):
+        """ Executes the given phase state for a single component """
+        if UVMDebug.DEBUG:
+            uvm_debug(self, 'traverse', self.get_name() +
+                ' traversing topdown phase now with comp' + comp.get_name())
         comp_domain = comp.get_domain()
 
-        if UVMPhase.m_phase_trace:
+        # Skip formatting the trace message if it would be filtered anyway
+        if (UVMPhase.m_phase_trace and
+                uvm_report_enabled(UVM_DEBUG, UVM_INFO, "PH_TRACE")):
             dom_name = "NO DOMAIN"
             if comp_domain is not None:
                 dom_name = comp_domain.get_name()
@@ -79,33 +102,33 @@ class UVMTopdownPhase(UVMPhase):
                 str(phase), str(state), comp.get_full_name(),
                     dom_name, phase_domain.get_name()), UVM_DEBUG)
 
-        from .uvm_domain import UVMDomain
-        if phase_domain == UVMDomain.get_common_domain() or phase_domain == comp_domain:
-            if state == UVM_PHASE_STARTED:
-                comp.m_current_phase = phase
-                comp.m_apply_verbosity_settings(phase)
-                comp.phase_started(phase)
-            elif state == UVM_PHASE_EXECUTING:
-                if not(phase.get_name() == "build" and comp.m_build_done):
-                    ph = self
-                    comp.m_phasing_active += 1
-                    if self in comp.m_phase_imps:
-                        ph = comp.m_phase_imps[self]
-                    ph.execute(comp, phase)
-                    comp.m_phasing_active -= 1
-            elif state == UVM_PHASE_READY_TO_END:
-                comp.phase_ready_to_end(phase)
-            elif state == UVM_PHASE_ENDED:
-                comp.phase_ended(phase)
-                comp.m_current_phase = None
-            else:
+        if phase_domain == common_domain or phase_domain == comp_domain:
+            handler = self._state_handlers.get(state)
+            if handler is None:
                 uvm_report_fatal("PH_BADEXEC","topdown phase traverse internal error")
+            else:
+                handler(comp, phase)
 
-        if comp.has_first_child():
-            child = comp.get_first_child()
-            while child is not None:
-                self.traverse(child, phase, state)
-                child = comp.get_next_child()
+    def _on_started(self, comp, phase):
+        comp.m_current_phase = phase
+        comp.m_apply_verbosity_settings(phase)
+        comp.phase_started(phase)
+
+    def _on_executing(self, comp, phase):
+        if not(phase.get_name() == "build" and comp.m_build_done):
+            ph = self
+            comp.m_phasing_active += 1
+            if self in comp.m_phase_imps:
+                ph = comp.m_phase_imps[self]
+            ph.execute(comp, phase)
+            comp.m_phasing_active -= 1
+
+    def _on_ready_to_end(self, comp, phase):
+        comp.phase_ready_to_end(phase)
+
+    def _on_ended(self, comp, phase):
+        comp.phase_ended(phase)
+        comp.m_current_phase = None
 
     def execute(self, comp, phase):
         """         
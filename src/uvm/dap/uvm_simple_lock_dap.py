@@ -24,7 +24,6 @@
 from .uvm_set_get_dap_base import uvm_set_get_dap_base
 from ..macros.uvm_object_defines import uvm_object_utils
 from ..macros.uvm_message_defines import *
-from ..base.sv import sv
 
 ERR_MSG1 = "Attempt to set new value on '%s', but the data access policy forbids setting while locked!"
 
@@ -49,8 +48,9 @@ class uvm_simple_lock_dap(uvm_set_get_dap_base):
     #   // Constructor
     def __init__(self, name="unnamed-uvm_simple_lock_dap"):
         uvm_set_get_dap_base.__init__(self, name)
-        self.m_locked = False
-        self.m_value = None
+        # (locked, value), always replaced as a whole
+        self._state = (False, None)
+        self._full_name = None
 
     #   // Group: Set/Get Interface
     #
@@ -60,10 +60,11 @@ class uvm_simple_lock_dap(uvm_set_get_dap_base):
     #   // ~set~ will result in an error if the DAP has
     #   // been locked.
     def set(self, value):
-        if (self.m_locked):
-            uvm_error("UVM/SIMPLE_LOCK_DAP/SAG", sv.sformatf(ERR_MSG1, self.get_full_name()))
+        if self._state[0]:
+            uvm_error("UVM/SIMPLE_LOCK_DAP/SAG",
+                lambda: ERR_MSG1 % self._cached_full_name())
         else:
-            self.m_value = value
+            self._state = (False, value)
 
     #   // Function: try_set
     #   // Attempts to update the value stored within the DAP.
@@ -86,7 +87,7 @@ class uvm_simple_lock_dap(uvm_set_get_dap_base):
     #   // Returns the current value stored within the DAP
     #   //
     def get(self):
-        return self.m_value
+        return self._state[1]
 
     #   // Function: try_get
     #   // Retrieves the current value stored within the DAP
@@ -98,6 +99,15 @@ class uvm_simple_lock_dap(uvm_set_get_dap_base):
     #   endfunction : try_get
     #
 
+    def set_name(self, name):
+        self._full_name = None
+        uvm_set_get_dap_base.set_name(self, name)
+
+    def _cached_full_name(self):
+        if self._full_name is None:
+            self._full_name = self.get_full_name()
+        return self._full_name
+
     #   // Group: Locking
     #
     #   // Function: lock
@@ -105,13 +115,13 @@ class uvm_simple_lock_dap(uvm_set_get_dap_base):
     #   //
     #   // The data value cannot be updated via <set> or <try_set> while locked.
     def lock(self):
-        self.m_locked = True
+        self._state = (True, self._state[1])
 
     #   // Function: unlock
     #   // Unlocks the data value
     #   //
     def unlock(self):
-        self.m_locked = False
+        self._state = (False, self._state[1])
 
     #
     #   // Function: is_locked
@@ -121,7 +131,7 @@ class uvm_simple_lock_dap(uvm_set_get_dap_base):
     #   // 1 - The value is locked
     #   // 0 - The value is unlocked
     def is_locked(self):
-        return self.m_locked
+        return self._state[0]
 
     #
     #   // Group: Introspection
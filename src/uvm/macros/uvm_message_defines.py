@@ -158,9 +158,14 @@ def uvm_warning(ID, MSG):
 #// uvm_report_error call.
 #//
 #// |`uvm_error(ID, MSG)
+#//
+#// ~MSG~ can also be a callable returning the message text, in which case
+#// it is only called if the error is enabled.
 
 def uvm_error(ID, MSG):
     if uvm_report_enabled(UVM_NONE, UVM_ERROR,ID):
+        if callable(MSG):
+            MSG = MSG()
         caller = getframeinfo(stack()[1][0])
         fname = caller.filename
         lineno = caller.lineno
@@ -264,7 +264,8 @@ def uvm_field_utils_end(T):
 def uvm_field_val(name, mask):
     vals = getattr(__CURR_OBJ, "_m_uvm_field_names")
     masks = getattr(__CURR_OBJ, "_m_uvm_field_masks")
-    vals.append(name)
+    if name not in masks:
+        vals.append(name)
     masks[name] = mask
 
 def uvm_field_int(name, mask=UVM_DEFAULT):
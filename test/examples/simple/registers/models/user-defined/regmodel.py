@@ -61,14 +61,13 @@ class user_acp_reg(UVMReg):
         UVMReg.__init__(self, name,16,UVM_NO_COVERAGE)
 
     def build(self):
-        self.value = UVMRegField.type_id.create("value", None, self.get_full_name())
+        full_name = self.get_full_name()
+        self.value = UVMRegField.type_id.create("value", None, full_name)
         self.value.configure(self, 16, 0, "RW", 0, 0x0000, 1, 0, 0);
         self.value.set_compare(UVM_NO_CHECK);
 
-        UVMResourceDb.set("REG::" + self.get_full_name(),
-                "NO_REG_BIT_BASH_TEST", 1)
-        UVMResourceDb.set("REG::" + self.get_full_name(),
-                "NO_REG_ACCESS_TEST", 1);
+        UVMResourceDb.set("REG::" + full_name, "NO_REG_BIT_BASH_TEST", 1)
+        UVMResourceDb.set("REG::" + full_name, "NO_REG_ACCESS_TEST", 1);
         self.cb = user_acp_incr_on_write_cbs()
         UVMRegFieldCb.add(self.value, self.cb)
         #   endfunction: build
@@ -89,7 +88,6 @@ class user_acp_reg(UVMReg):
         # with the incremented value to emulate the front-door
         if (rw.path == UVM_BACKDOOR):
             rw.value[0] = m_data
-        await Timer(5, "NS")
         #   endtask: pre_write
     #
     #endclass : user_acp_reg
@@ -1,6 +1,8 @@
 
 import unittest
-from uvm.base.sv import (sv, sv_obj, uvm_glob_to_re)
+from enum import IntEnum
+import cocotb
+from uvm.base.sv import (sv, sv_obj, uvm_glob_to_re, SV_MAX_INT_VALUE)
 
 
 class Packet(sv_obj):
@@ -36,6 +38,14 @@ class TestSV(unittest.TestCase):
         self.assertEqual(pp.tx_id, 888)
         self.assertEqual(3 * pp.addr, pp.b_addr)
 
+        pp.sub = Packet("sub")
+        pp.rand("sub")
+        other = Packet("other")
+        pp.rand(other)
+        self.assertEqual(pp.randomize(), True)
+        self.assertEqual(3 * pp.sub.addr, pp.sub.b_addr)
+        self.assertEqual(3 * other.addr, other.b_addr)
+
         #ok = pp.randomize_with([["addr", [5, 6, 7]]])
         #self.assertEqual(ok, True)
         #self.assertEqual(pp.addr, 3 * pp.b_addr)
@@ -56,6 +66,9 @@ class TestSV(unittest.TestCase):
         res4 = uvm_glob_to_re(str4)
         self.assertEqual(res4, '__top__\\.master\\[0\\]\\.slave.*')
 
+        self.assertEqual(uvm_glob_to_re("a?b.*"), 'a.b\\..*')
+        self.assertEqual(uvm_glob_to_re("/a.*b/"), '/a.*b/')
+
     def test_cast(self):
         my_int = 6
         arr = []
@@ -77,11 +90,53 @@ class TestSV(unittest.TestCase):
         ]
         for pair in test_str:
             str1 = sv.sformatf(pair[0], pair[1])
+        self.assertEqual(sv.sformatf("Hex: %0h, %h", 255, 16), "Hex: FF, 10")
+        self.assertEqual(sv.sformatf("%0t/%t %p", 10, 20, [1]), "10/20 [1]")
+        self.assertEqual(sv.sformatf("%0d %s", True, (1, 2)), "True (1, 2)")
+        self.assertEqual(sv.sformatf("%0d%%", 50), "50%%")
+        self.assertEqual(sv.sformatf("No args {x}"), "No args {x}")
+
+    def test_sformatf_custom_format(self):
+        class Fmt():
+            def __format__(self, spec):
+                return "FMT"
+
+            def __str__(self):
+                return "STR"
 
+        class Status(IntEnum):
+            OK = 1
+        self.assertEqual(sv.sformatf("%s", Fmt()), "FMT")
+        self.assertEqual(sv.sformatf("%0d", Status.OK), "{}".format(Status.OK))
 
 
+    def test_value_plusargs(self):
+        self.addCleanup(cocotb.plusargs.pop, 'UVM_TESTNAME', None)
+        cocotb.plusargs['UVM_TESTNAME'] = 'my_test'
+        arr = []
+        self.assertEqual(sv.value_plusargs("UVM_TESTNAME=%s", arr), 'my_test')
+        self.assertEqual(arr, ['my_test'])
+        arr = []
+        self.assertEqual(sv.value_plusargs("UVM", arr), None)
+        self.assertEqual(arr, [])
+
+    def test_random(self):
+        for i in range(100):
+            self.assertTrue(0 <= sv.urandom() <= SV_MAX_INT_VALUE)
+            self.assertTrue(0 <= sv.random() <= SV_MAX_INT_VALUE)
+            self.assertTrue(3 <= sv.urandom_range(3, 5) <= 5)
+        self.assertEqual(sv.urandom_range(7, 7), 7)
+
+    def test_bits(self):
+        self.assertEqual(sv.bits(5), 32)
+        self.assertEqual(sv.bits(True), 32)
+        self.assertEqual(sv.bits("abc"), 0)
+        self.assertEqual(sv.isunknown(5), False)
+
     def test_clog2(self):
+        self.assertEqual(sv.clog2(-5), 0)
         self.assertEqual(sv.clog2(0), 0)
+        self.assertEqual(sv.clog2(1), 0)
         self.assertEqual(sv.clog2(3), 2)
         self.assertEqual(sv.clog2(5), 3)
         self.assertEqual(sv.clog2(16), 4)
@@ -0,0 +1,71 @@
+import unittest
+
+from uvm.base.uvm_event import UVMEvent
+
+
+class EventCb():
+
+    def __init__(self, skip=False):
+        self.skip = skip
+        self.pre_called = 0
+        self.post_called = 0
+
+    def pre_trigger(self, e, data):
+        self.pre_called += 1
+        return self.skip
+
+    def post_trigger(self, e, data):
+        self.post_called += 1
+
+
+class TestUVMEvent(unittest.TestCase):
+
+    def test_trigger_callbacks(self):
+        ev = UVMEvent("ev")
+        cb1 = EventCb()
+        cb2 = EventCb()
+        ev.add_callback(cb1)
+        ev.add_callback(cb2, append=False)
+        self.assertEqual(ev.callbacks, [cb2, cb1])
+        ev.trigger(123)
+        self.assertEqual([cb1.pre_called, cb2.pre_called], [1, 1])
+        self.assertEqual([cb1.post_called, cb2.post_called], [1, 1])
+        self.assertEqual(ev.is_on(), True)
+        self.assertEqual(ev.get_trigger_data(), 123)
+
+    def test_trigger_skip(self):
+        ev = UVMEvent("ev_skip")
+        cb_skip = EventCb(skip=True)
+        cb = EventCb()
+        ev.add_callback(cb_skip)
+        ev.add_callback(cb)
+        ev.trigger()
+        self.assertEqual([cb_skip.pre_called, cb.pre_called], [1, 1])
+        self.assertEqual([cb_skip.post_called, cb.post_called], [0, 0])
+        self.assertEqual(ev.is_on(), False)
+
+    def test_trigger_sv_style_skip(self):
+        # SV pre_trigger returns a bit, so 0/1 must work as well
+        ev = UVMEvent("ev_skip_bit")
+        cb0 = EventCb(skip=0)
+        ev.add_callback(cb0)
+        ev.trigger()
+        self.assertEqual(ev.is_on(), True)
+        cb1 = EventCb(skip=1)
+        ev.add_callback(cb1)
+        ev.reset()
+        ev.trigger()
+        self.assertEqual(ev.is_on(), False)
+        self.assertEqual([cb0.pre_called, cb1.pre_called], [2, 1])
+
+    def test_reset(self):
+        ev = UVMEvent("ev_reset")
+        ev.trigger()
+        self.assertEqual(ev.is_on(), True)
+        ev.reset()
+        self.assertEqual(ev.is_off(), True)
+        self.assertEqual(ev.get_trigger_time(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
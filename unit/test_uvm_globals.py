@@ -1,11 +1,18 @@
 
 import unittest
+import io
+import contextlib
 
 from uvm.base.uvm_globals import (
     uvm_report_enabled,
-    uvm_is_match
+    uvm_report_info,
+    uvm_report_warning,
+    uvm_is_match,
+    uvm_check_output_args,
+    uvm_invalidate_report_cache
 )
 
+from uvm.base.uvm_root import UVMRoot
 from uvm.base.uvm_object_globals import (
     UVM_INFO, UVM_MEDIUM, UVM_HIGH,
     UVM_FATAL
@@ -20,6 +27,33 @@ class TestUVMGlobals(unittest.TestCase):
         self.assertFalse(uvm_report_enabled(UVM_HIGH, UVM_INFO))
         self.assertTrue(uvm_report_enabled(UVM_MEDIUM, UVM_FATAL))
 
+    def test_uvm_report_enabled_verbosity_change(self):
+        top = UVMRoot.get()
+        self.addCleanup(self.restore_verbosity, top,
+            top.get_report_verbosity_level())
+        self.assertFalse(uvm_report_enabled(UVM_HIGH, UVM_INFO, "VERB_ID"))
+        top.set_report_id_verbosity("VERB_ID", UVM_HIGH)
+        self.assertTrue(uvm_report_enabled(UVM_HIGH, UVM_INFO, "VERB_ID"))
+        top.set_report_verbosity_level(UVM_HIGH)
+        self.assertTrue(uvm_report_enabled(UVM_HIGH, UVM_INFO))
+        top.set_report_verbosity_level(UVM_MEDIUM)
+        self.assertFalse(uvm_report_enabled(UVM_HIGH, UVM_INFO))
+
+    def restore_verbosity(self, top, verbosity):
+        id_verbs = top.m_rh.id_verbosities
+        if id_verbs.exists("VERB_ID"):
+            id_verbs.delete("VERB_ID")
+        top.set_report_verbosity_level(verbosity)
+        uvm_invalidate_report_cache()
+
+    def test_uvm_report_caller_info(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            uvm_report_info("GLOB_TEST", "info msg")
+            uvm_report_warning("GLOB_TEST", "warn msg", filename="xx.py", line=77)
+        lines = out.getvalue().splitlines()
+        self.assertRegex(lines[0], r'test_uvm_globals\.py\(\d+\)')
+        self.assertRegex(lines[1], r'xx\.py\(77\)')
 
     def test_uvm_is_match(self):
         self.assertTrue(uvm_is_match("my_name*", "my_name.child1.c2"))
@@ -28,6 +62,13 @@ class TestUVMGlobals(unittest.TestCase):
         self.assertFalse(uvm_is_match("my_name??????", "my_name.abc"))
         self.assertTrue(uvm_is_match("zzz*www??yy", "zzz_abcdefg_wwwKKyy"))
 
+    def test_uvm_check_output_args(self):
+        uvm_check_output_args([[], []])
+        with self.assertRaises(Exception):
+            uvm_check_output_args([[], 0])
+        with self.assertRaises(Exception):
+            uvm_check_output_args([[1]])
+
 
 if __name__ == '__main__':
     unittest.main()
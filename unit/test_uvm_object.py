@@ -34,6 +34,72 @@ uvm_field_object("my_obj")
 uvm_object_utils_end(SuperObj)
 
 
+class NoCmpObj(UVMObject):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.val = 0
+        self.skip = 0
+
+uvm_object_utils_begin(NoCmpObj)
+uvm_field_int("val")
+uvm_field_int("skip", UVM_DEFAULT | UVM_NOCOMPARE)
+uvm_object_utils_end(NoCmpObj)
+
+
+class KeywordObj(UVMObject):
+
+    def __init__(self, name):
+        super().__init__(name)
+        setattr(self, "from", 1)
+
+uvm_object_utils_begin(KeywordObj)
+uvm_field_int("from")
+uvm_object_utils_end(KeywordObj)
+
+
+class CmpMaskBase(UVMObject):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.a = 1
+        self.b = 2
+
+uvm_object_utils_begin(CmpMaskBase)
+uvm_field_int("a")
+uvm_field_int("b")
+uvm_object_utils_end(CmpMaskBase)
+
+
+class CmpMaskSub(CmpMaskBase):
+    pass
+
+uvm_object_utils_begin(CmpMaskSub)
+uvm_field_int("a", UVM_DEFAULT | UVM_NOCOMPARE)
+uvm_object_utils_end(CmpMaskSub)
+
+
+class CopyMaskBase(UVMObject):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.a = 1
+        self.b = 2
+
+uvm_object_utils_begin(CopyMaskBase)
+uvm_field_int("a")
+uvm_field_int("b")
+uvm_object_utils_end(CopyMaskBase)
+
+
+class CopyMaskSub(CopyMaskBase):
+    pass
+
+uvm_object_utils_begin(CopyMaskSub)
+uvm_field_int("a", UVM_DEFAULT | UVM_NOCOPY)
+uvm_object_utils_end(CopyMaskSub)
+
+
 class TestUVMObject(unittest.TestCase):
 
     def test_name(self):
@@ -62,6 +128,62 @@ class TestUVMObject(unittest.TestCase):
         so2.my_obj.data = 666
         self.assertFalse(sup_obj.compare(so2))
 
+    def test_copy_fields(self):
+        sup_obj = SuperObj("super_obj")
+        sup_obj.my_val = 7
+        so2 = sup_obj.clone()
+        self.assertEqual(so2.get_name(), "super_obj")
+        self.assertEqual(so2.my_val, 7)
+        self.assertIsNot(so2.my_obj, sup_obj.my_obj)
+        self.assertEqual(so2.my_obj.addr, 3)
+
+        o1 = NoCmpObj("o1")
+        o1.val = 4
+        o2 = NoCmpObj("o2")
+        o2.copy(o1)
+        self.assertEqual(o2.val, 4)
+        self.assertEqual(o2.get_name(), "o2")
+
+    def test_compare_fields(self):
+        o1 = TestObj("o1")
+        o2 = o1.clone()
+        self.assertTrue(o1.compare(o2))
+        o2.addr = 5
+        o2.data = 11
+        self.assertFalse(o1.compare(o2))
+        from uvm.base.uvm_global_vars import uvm_default_comparer
+        self.assertEqual(uvm_default_comparer.result, 1)
+
+        o3 = NoCmpObj("o3")
+        o4 = o3.clone()
+        o4.skip = 1
+        self.assertTrue(o3.compare(o4))
+        o4.val = 1
+        self.assertFalse(o3.compare(o4))
+
+    def test_subclass_nocompare(self):
+        o1 = CmpMaskSub("o1")
+        o2 = o1.clone()
+        o2.a = 9
+        self.assertTrue(o1.compare(o2))
+        o2.b = 9
+        self.assertFalse(o1.compare(o2))
+
+    def test_subclass_nocopy(self):
+        o1 = CopyMaskSub("o1")
+        o1.a = 9
+        o1.b = 9
+        o2 = o1.clone()
+        self.assertEqual(o2.a, 1)
+        self.assertEqual(o2.b, 9)
+
+    def test_keyword_field(self):
+        o1 = KeywordObj("o1")
+        o2 = o1.clone()
+        self.assertEqual(getattr(o2, "from"), 1)
+        setattr(o2, "from", 2)
+        self.assertFalse(o1.compare(o2))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,11 +1,13 @@
 
 import unittest
+import io
+import contextlib
 
 from uvm.macros import uvm_component_utils, uvm_object_utils
 from uvm.base.uvm_debug import UVMDebug
 from uvm.base.uvm_object import UVMObject
 from uvm.base.uvm_coreservice import UVMCoreService
-from uvm.base.uvm_registry import UVMComponentRegistry
+from uvm.base.uvm_registry import UVMComponentRegistry, UVMObjectRegistry
 
 class TestUVMObjectDefines(unittest.TestCase):
     
@@ -68,5 +70,43 @@ class TestUVMObjectDefines(unittest.TestCase):
         type_obj = o.get_type()
         self.assertEqual(type_obj is not None, True)        
 
+    def test_object_utils_subclass(self):
+        @uvm_object_utils
+        class Obj(UVMObject):
+            pass
+
+        @uvm_object_utils
+        class SubObj(Obj):
+            pass
+        self.assertIsNot(SubObj.type_id, Obj.type_id)
+        self.assertEqual(SubObj.type_name, 'SubObj')
+
+    def test_object_utils_after_registry_clear(self):
+        @uvm_object_utils
+        class ClearedObj(UVMObject):
+            pass
+        # Same as UVMObjectRegistry.reset(), but only for this type
+        for db in [UVMObjectRegistry.objs, UVMObjectRegistry.registered,
+                UVMObjectRegistry.registry_db]:
+            del db['ClearedObj']
+        uvm_object_utils(ClearedObj)
+        obj = ClearedObj.type_id.create("obj")
+        self.assertEqual(obj.get_type_name(), 'ClearedObj')
+
+    def test_object_utils_same_name(self):
+        @uvm_object_utils
+        class SameName(UVMObject):
+            pass
+        Old = SameName
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            @uvm_object_utils
+            class SameName(UVMObject):
+                pass
+        self.assertIn("SameName has already been added", out.getvalue())
+        self.assertIsNot(SameName.type_id, Old.type_id)
+        self.assertIs(UVMObjectRegistry.objs['SameName'], SameName)
+
 if __name__ == '__main__':
     unittest.main()
@@ -20,6 +20,13 @@ class TestUVMPool(unittest.TestCase):
         last_key = pool.last()
         self.assertEqual(first_key, 'xxx')
         self.assertEqual(first_key, last_key)
+        pool.add('none', None)
+        self.assertIsNone(pool.get('none'))
+        self.assertIsNone(pool.get('not_there'))
+        self.assertEqual(pool.num(), 2)
+        int_pool = UVMPool("int_pool", T=int)
+        self.assertEqual(int_pool.get('new'), 0)
+        self.assertTrue(int_pool.exists('new'))
 
     def test_pool_iter(self):
         pool = UVMPool()
@@ -36,6 +43,22 @@ class TestUVMPool(unittest.TestCase):
         self.assertEqual(pool.prev(), 'a')
         self.assertEqual(pool.next(), 'b')
         self.assertEqual(pool.next(), 'c')
+        pool.add('d', 4)
+        self.assertEqual(pool.next(), 'd')
+        pool.delete('b')
+        self.assertEqual(pool.first(), 'a')
+        self.assertEqual(pool.next(), 'c')
+
+    def test_get_many(self):
+        pool = UVMPool()
+        pool.add('a', 1)
+        pool.add('b', None)
+        self.assertEqual(pool.get_many(['b', 'a', 'c']), [None, 1, None])
+        self.assertEqual(pool.num(), 2)
+        int_pool = UVMPool("int_pool", T=int)
+        int_pool.add('x', 5)
+        self.assertEqual(int_pool.get_many(['x', 'y']), [5, 0])
+        self.assertEqual(int_pool.last(), 'y')
 
     def test_len_and_in(self):
         pool = UVMPool()
@@ -81,6 +104,24 @@ class TestUVMEventPool(unittest.TestCase):
         self.assertIs(evt_end, evt_end2)
         self.assertNotEqual(evt_end, evt_start)
 
+    def test_event_pool_get_many(self):
+        event_pool = UVMEventPool('event_pool_many')
+        evt_start = event_pool.get('start')
+        evts = event_pool.get_many(['start', 'end'])
+        self.assertIs(evts[0], evt_start)
+        self.assertEqual(evts[1].get_name(), 'end')
+        self.assertIs(event_pool.get('end'), evts[1])
+
+    def test_event_pool_delete(self):
+        event_pool = UVMEventPool('event_pool_del')
+        event_pool.get('ev1')
+        event_pool.get('ev2')
+        event_pool.delete('ev1')
+        self.assertFalse(event_pool.exists('ev1'))
+        self.assertEqual(event_pool.num(), 1)
+        event_pool.delete('ev1')  # Gives a warning only
+        self.assertEqual(event_pool.first(), 'ev2')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import io
+import contextlib
+
+from uvm.dap.uvm_simple_lock_dap import uvm_simple_lock_dap
+from uvm.base.uvm_root import UVMRoot
+from uvm.base.uvm_object_globals import UVM_ERROR, UVM_NONE
+
+SAG_ID = "UVM/SIMPLE_LOCK_DAP/SAG"
+
+
+class TestUVMSimpleLockDAP(unittest.TestCase):
+
+    def test_set_get_lock(self):
+        dap = uvm_simple_lock_dap("dap")
+        self.assertIsNone(dap.get())
+        self.assertFalse(dap.is_locked())
+        dap.set("a.log")
+        self.assertEqual(dap.get(), "a.log")
+        dap.lock()
+        self.assertTrue(dap.is_locked())
+        self.assertEqual(dap.get(), "a.log")
+        dap.unlock()
+        self.assertFalse(dap.is_locked())
+        dap.set("b.log")
+        self.assertEqual(dap.get(), "b.log")
+
+    def set_sag_verbosity(self, verbosity):
+        top = UVMRoot.get()
+        old_verb = top.get_report_verbosity_level(UVM_ERROR, SAG_ID)
+        self.addCleanup(top.set_report_severity_id_verbosity, UVM_ERROR,
+            SAG_ID, old_verb)
+        top.set_report_severity_id_verbosity(UVM_ERROR, SAG_ID, verbosity)
+
+    def test_set_while_locked_msg(self):
+        self.set_sag_verbosity(UVM_NONE)
+        dap = uvm_simple_lock_dap("dap")
+        dap.lock()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            dap.set(2)
+        self.assertIsNone(dap.get())
+        self.assertIn("Attempt to set new value on 'dap', but the data access "
+            + "policy forbids setting while locked!", out.getvalue())
+
+    def test_set_while_locked_lazy_msg(self):
+        self.set_sag_verbosity(UVM_NONE - 1)
+        dap = uvm_simple_lock_dap("dap")
+        dap.set(1)
+        dap.lock()
+        called = []
+        dap.get_full_name = lambda: called.append(1) or "dap"
+        dap.set(2)
+        self.assertEqual(dap.get(), 1)
+        self.assertEqual(called, [])
+
+    def test_cached_full_name(self):
+        dap = uvm_simple_lock_dap("dap")
+        self.assertEqual(dap._cached_full_name(), "dap")
+        dap.set_name("renamed")
+        self.assertEqual(dap._cached_full_name(), "renamed")
+
+
+if __name__ == '__main__':
+    unittest.main()
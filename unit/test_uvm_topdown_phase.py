@@ -6,6 +6,13 @@ from uvm.base.uvm_phase import UVMPhase
 from uvm.base.uvm_object_globals import *
 
 
+class OrderComp(UVMComponent):
+    visited = []
+
+    def phase_started(self, phase):
+        OrderComp.visited.append(self.get_name())
+
+
 class TestUVMTopdownPhase(unittest.TestCase):
 
 
@@ -28,6 +35,20 @@ class TestUVMTopdownPhase(unittest.TestCase):
         self.assertEqual(len(children_c2), 1)
         self.assertEqual(children_c2[0].get_name(), c4.get_name())
 
+    def test_traverse_order(self):
+        top = OrderComp('top__test_traverse_order', None)
+        c1 = OrderComp('c1', top)
+        OrderComp('c1_c1', c1)
+        OrderComp('c1_c2', c1)
+        c2 = OrderComp('c2', top)
+        OrderComp('c2_c1', c2)
+        td_phase = UVMTopdownPhase('MyOrderPhase')
+        phase = top.get_domain()  # Phase must be in the domain of comps
+        OrderComp.visited = []
+        td_phase.traverse(top, phase, UVM_PHASE_STARTED)
+        self.assertEqual(OrderComp.visited, ['top__test_traverse_order',
+            'c1', 'c1_c1', 'c1_c2', 'c2', 'c2_c1'])
+
 
 if __name__ == '__main__':
     unittest.main()